@@ -6,6 +6,7 @@ import win32com.client as win32
 import threading
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from polling_observer import PollingExcelObserver
 import io
 import time
 from pathlib import Path
@@ -154,10 +155,11 @@ class FileChangeHandler(FileSystemEventHandler):
             if result:
                 st.text(result)
 
-def monitor_excel_file(file_path):
+def monitor_excel_file(file_path, use_polling=False):
     """Start the watchdog observer to monitor changes in the file"""
     event_handler = FileChangeHandler(st.session_state.df, st.session_state.template_paths)
-    observer = Observer()
+    # Network shares and OneDrive folders miss native events, so poll there
+    observer = PollingExcelObserver() if use_polling else Observer()
     observer.schedule(event_handler, path=os.path.dirname(file_path), recursive=False)
     observer.start()
     return observer
@@ -171,6 +173,11 @@ st.sidebar.header("Configuration")
 # File upload section
 st.sidebar.subheader("Upload Candidate Data")
 uploaded_file = st.sidebar.file_uploader("Upload Excel file", type=["xlsx", "xls"])
+use_polling = st.sidebar.checkbox(
+    "Poll for changes (network share / OneDrive)",
+    value=False,
+    help="Use if offer sheet edits are not being picked up"
+)
 
 if uploaded_file is not None:
     try:
@@ -185,8 +192,14 @@ if uploaded_file is not None:
             
         st.sidebar.success("File uploaded successfully!")
         
-        # Start file monitoring in a background thread
-        st.session_state.observer = monitor_excel_file(uploaded_file.name)
+        # Start file monitoring in a background thread. Streamlit reruns the
+        # script on every interaction, so only restart when file or mode changes
+        monitor_key = (uploaded_file.name, use_polling)
+        if st.session_state.get('monitor_key') != monitor_key:
+            if st.session_state.get('observer') is not None:
+                st.session_state.observer.stop()
+            st.session_state.observer = monitor_excel_file(uploaded_file.name, use_polling)
+            st.session_state.monitor_key = monitor_key
     except Exception as e:
         st.sidebar.error(f"Error: {str(e)}")
 
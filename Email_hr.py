@@ -7,6 +7,9 @@ from email.mime.multipart import MIMEMultipart
 import logging
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from polling_observer import PollingExcelObserver, is_network_or_synced_path
+
+WATCH_MODES = ('polling', 'native', 'auto')
 
 class ExcelChangeHandler(FileSystemEventHandler):
     def __init__(self, email_sender):
@@ -76,6 +79,16 @@ class EmailAutomationSystem:
             self.template_file = config_df.loc[config_df['Key'] == 'TEMPLATE_FILE', 'Value'].values[0]
             self.tracking_folder = config_df.loc[config_df['Key'] == 'TRACKING_FOLDER', 'Value'].values[0]
             
+            # Optional: 'polling', 'native' or 'auto' (poll on network shares / OneDrive)
+            watch_mode = config_df.loc[config_df['Key'] == 'WATCH_MODE', 'Value'].values
+            if len(watch_mode) and pd.notna(watch_mode[0]) and str(watch_mode[0]).strip():
+                self.watch_mode = str(watch_mode[0]).strip().lower()
+            else:
+                self.watch_mode = 'auto'
+            if self.watch_mode not in WATCH_MODES:
+                logging.warning(f"Unknown WATCH_MODE '{self.watch_mode}', falling back to 'auto'")
+                self.watch_mode = 'auto'
+            
             logging.info("Configuration loaded successfully")
         
         except Exception as e:
@@ -188,8 +201,11 @@ def main():
     # Create file change handler
     event_handler = ExcelChangeHandler(email_sender)
     
-    # Create observer
-    observer = Observer()
+    # Create observer - fall back to polling where native events are unreliable
+    use_polling = email_sender.watch_mode == 'polling' or (
+        email_sender.watch_mode == 'auto' and is_network_or_synced_path(email_sender.candidates_file)
+    )
+    observer = PollingExcelObserver() if use_polling else Observer()
     observer.schedule(
         event_handler, 
         path=os.path.dirname(email_sender.candidates_file), 
@@ -200,7 +216,7 @@ def main():
     observer.start()
     
     try:
-        logging.info("Excel change monitoring started")
+        logging.info(f"Excel change monitoring started ({'polling' if use_polling else 'native'} mode)")
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
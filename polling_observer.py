@@ -0,0 +1,257 @@
+import os
+import ctypes
+import hashlib
+import logging
+import threading
+from watchdog.events import FileCreatedEvent, FileDeletedEvent, FileModifiedEvent
+
+WORKBOOK_EXTENSIONS = ('.xlsx', '.xls')
+
+# Polls a workbook may be missing before it's reported as deleted. Excel and
+# OneDrive save by replacing the file, which leaves a short gap on slow shares.
+MISSING_POLLS_BEFORE_DELETE = 2
+
+# GetDriveTypeW result for a mapped network drive
+DRIVE_REMOTE = 4
+
+
+def is_network_or_synced_path(path):
+    """
+    Return True for SMB shares (UNC or mapped drive) and OneDrive
+    folders, where native file system events are unreliable
+    """
+    path = os.path.abspath(str(path))
+    if path.startswith(('\\\\', '//')):
+        return True
+    drive = os.path.splitdrive(path)[0]
+    if os.name == 'nt' and drive:
+        # Mapped drive letters (e.g. S:\HR) hide the UNC path
+        if ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == DRIVE_REMOTE:
+            return True
+    onedrive_roots = [os.environ.get(key) for key in ('OneDrive', 'OneDriveCommercial', 'OneDriveConsumer')]
+    for root in filter(None, onedrive_roots):
+        if os.path.normcase(path).startswith(os.path.normcase(os.path.abspath(root))):
+            return True
+    return 'onedrive' in os.path.normcase(path)
+
+
+def hash_file(path, chunk_size=1024 * 1024):
+    """
+    Compute a content digest of a file, reading it in chunks
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PollingExcelObserver(threading.Thread):
+    """
+    Drop-in replacement for the watchdog Observer that polls workbooks.
+
+    Every poll costs one directory scan per watched folder. schedule() only
+    records size and mtime; the observer thread hashes those baselines on
+    its first poll. After that a file is only hashed when its size or mtime
+    changes, and an event is only dispatched when the content digest
+    actually differs, so OneDrive/SMB metadata touches and duplicate writes
+    are ignored. A file that disappears is kept as a tombstone for a poll,
+    so a save that replaces it still arrives as a modification. The poll
+    interval doubles while nothing changes (up to max_interval) and drops
+    back to min_interval as soon as a change is seen or pending.
+    """
+
+    def __init__(self, min_interval=1.0, max_interval=30.0, extensions=WORKBOOK_EXTENSIONS):
+        super().__init__(daemon=True)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self._watches = []
+        self._file_watches = set()
+        self._snapshots = {}
+        self._missing = {}
+        # Re-entrant so a handler may call schedule() from inside a dispatch
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+
+    def schedule(self, event_handler, path, recursive=False):
+        """
+        Watch a folder (or a single workbook) and send changes to event_handler.
+        Safe to call before or after start().
+        """
+        path = os.path.abspath(path or '.')
+        with self._lock:
+            self._watches.append((event_handler, path, recursive))
+            if os.path.isfile(path):
+                self._file_watches.add(path)
+            # Stat-only baseline so existing workbooks don't fire on startup;
+            # the digest is filled in by the next poll on the observer thread
+            found, _ = self._scan(path, recursive) or ([], [])
+            for file_path, stat in found:
+                self._snapshots.setdefault(file_path, (stat.st_size, stat.st_mtime_ns, None))
+        logging.info(f"Polling {path} for workbook changes")
+
+    def run(self):
+        # Poll straight away so baselines are hashed before any edits land
+        while not self._stop_event.is_set():
+            try:
+                changed = self.poll()
+            except Exception as e:
+                logging.error(f"Polling observer error: {e}")
+                changed = False
+
+            if changed:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * 2, self.max_interval)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+
+    def join(self, timeout=None):
+        if self.is_alive():
+            super().join(timeout)
+
+    def poll(self):
+        """
+        Check all watched paths once and dispatch events. Returns True if
+        any workbook was created, modified or deleted, or a change is still
+        pending (file locked or temporarily missing).
+        """
+        changed = False
+        with self._lock:
+            for event_handler, path, recursive in list(self._watches):
+                scan = self._scan(path, recursive)
+                if scan is None:
+                    # Don't report every workbook as deleted while the share is unreachable
+                    continue
+                found, unknown = scan
+
+                seen = set()
+                for file_path, stat in found:
+                    seen.add(file_path)
+                    self._missing.pop(file_path, None)
+                    event, pending = self._check(file_path, stat)
+                    if event is not None:
+                        event_handler.dispatch(event)
+                    changed = changed or pending or event is not None
+
+                for file_path in self._owned_paths(path, recursive, unknown) - seen:
+                    # Keep polling quickly while a file is missing, so a
+                    # replace-save is picked up before it counts as a delete
+                    changed = True
+                    self._missing[file_path] = self._missing.get(file_path, 0) + 1
+                    if self._missing[file_path] >= MISSING_POLLS_BEFORE_DELETE:
+                        del self._missing[file_path]
+                        del self._snapshots[file_path]
+                        event_handler.dispatch(FileDeletedEvent(file_path))
+
+        return changed
+
+    def _check(self, file_path, stat):
+        """
+        Compare a workbook against its snapshot. Returns (event, pending),
+        where pending means a change was seen but the file couldn't be read yet.
+        """
+        previous = self._snapshots.get(file_path)
+        if previous is None:
+            self._snapshots[file_path] = self._snapshot(file_path, stat)
+            return FileCreatedEvent(file_path), False
+
+        size, mtime, digest = previous
+        if (stat.st_size, stat.st_mtime_ns) == (size, mtime):
+            if digest is None:
+                # Fill in a baseline digest; a failure here is retried quietly
+                self._snapshots[file_path] = self._snapshot(file_path, stat)
+            return None, False
+
+        # Size or mtime moved, so it's worth reading the content
+        current = self._snapshot(file_path, stat)
+        if current[2] is None:
+            # Still locked mid-write/sync; keep the old snapshot and retry soon
+            return None, True
+        self._snapshots[file_path] = current
+        # Only a baseline that was never readable has no digest to compare
+        if digest is not None and current[2] == digest:
+            return None, False
+        return FileModifiedEvent(file_path), False
+
+    def _snapshot(self, file_path, stat):
+        try:
+            digest = hash_file(file_path)
+        except OSError as e:
+            # Excel or the sync client may still hold the file; retry next poll
+            logging.warning(f"Could not read {file_path}: {e}")
+            digest = None
+        return (stat.st_size, stat.st_mtime_ns, digest)
+
+    def _scan(self, path, recursive):
+        """
+        Return (found, unknown) for the workbooks under path, where found is
+        (path, stat) pairs and unknown lists files or subfolders that could
+        not be checked this time. Returns None if path itself could not be
+        checked (e.g. the share is offline).
+        """
+        if path in self._file_watches:
+            try:
+                return [(path, os.stat(path))], []
+            except FileNotFoundError:
+                # Only a real deletion if the containing folder is reachable
+                return ([], []) if os.path.isdir(os.path.dirname(path)) else None
+            except OSError as e:
+                logging.warning(f"Could not stat {path}: {e}")
+                return None
+
+        try:
+            entries = list(os.scandir(path))
+        except OSError as e:
+            logging.warning(f"Could not scan {path}: {e}")
+            return None
+
+        found, unknown = [], []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                unknown.append(entry.path)
+                continue
+
+            if is_dir:
+                if recursive:
+                    # An unreadable subfolder only hides its own subtree
+                    subtree = self._scan(entry.path, recursive)
+                    if subtree is None:
+                        unknown.append(entry.path)
+                    else:
+                        found.extend(subtree[0])
+                        unknown.extend(subtree[1])
+            elif self._is_workbook(entry.name):
+                try:
+                    found.append((entry.path, entry.stat()))
+                except OSError as e:
+                    logging.warning(f"Could not stat {entry.path}: {e}")
+                    unknown.append(entry.path)
+        return found, unknown
+
+    def _is_workbook(self, name):
+        # Skip Excel's "~$" lock files
+        return name.lower().endswith(self.extensions) and not name.startswith('~$')
+
+    def _owned_paths(self, path, recursive, unknown=()):
+        """
+        Snapshotted workbooks under path, leaving out any that sit in (or are)
+        an unknown path, so they keep their snapshot instead of being deleted
+        """
+        if path in self._file_watches:
+            return {path} & self._snapshots.keys()
+        unknown_dirs = tuple(p + os.sep for p in unknown)
+        owned = set()
+        for file_path in self._snapshots:
+            if file_path in unknown or file_path.startswith(unknown_dirs):
+                continue
+            parent = os.path.dirname(file_path)
+            if parent == path or (recursive and file_path.startswith(path + os.sep)):
+                owned.add(file_path)
+        return owned